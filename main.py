@@ -4,18 +4,27 @@ Main entry point for PDF extraction and Excel conversion pipeline.
 Supports single PDF or batch processing of all PDFs in a folder.
 """
 
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 import argparse
-import json
 
 # Add src directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-# Import the extraction and Excel creation modules
-from extract_pdf_tables import extract_structured_data
-from create_excel_file import create_excel_from_json
-from process_pdf import process_pdf
+from config import SEPARATOR
+
+
+def positive_int(value):
+    """
+    argparse type for options that need an integer of at least 1.
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
 
 
 def main():
@@ -51,6 +60,19 @@ def main():
         "--json-path",
         help="Path to existing JSON file (for --excel-only mode)",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=os.cpu_count() or 1,
+        help="Number of PDFs to process in parallel with --pdf-dir (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="Skip the per-PDF extraction summary",
+    )
 
     args = parser.parse_args()
 
@@ -65,9 +87,11 @@ def main():
             return 1
 
         # Excel-only mode
-        print("=" * 80)
+        from create_excel_file import create_excel_from_json
+
+        print(SEPARATOR)
         print("EXCEL CREATION MODE")
-        print("=" * 80)
+        print(SEPARATOR)
 
         excel_path = json_path.parent / f"{json_path.parent.name}.xlsx"
 
@@ -78,25 +102,67 @@ def main():
         print("\nExcel creation complete!\n")
         return 0
 
+    # Imported here so --help, argument errors and --excel-only don't pay for
+    # loading pdfplumber
+    from process_pdf import process_pdf
+
+    # Build the output root once and share it across every PDF
+    output_root = Path(args.output_dir)
+
     # Batch mode: process all PDFs in a folder
     if args.pdf_dir:
         pdf_dir = Path(args.pdf_dir)
-        if not pdf_dir.exists() or not pdf_dir.is_dir():
+
+        # scandir reuses the directory entry's file type instead of building
+        # and matching a Path for every entry, and its open() doubles as the
+        # existence check
+        try:
+            with os.scandir(pdf_dir) as entries:
+                pdf_files = [
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.lower().endswith(".pdf") and entry.is_file()
+                ]
+        except FileNotFoundError:
             print(f"Error: Directory not found: {pdf_dir}")
             return 1
-
-        pdf_files = list(pdf_dir.glob("*.pdf"))
+        except NotADirectoryError:
+            print(f"Error: Not a directory: {pdf_dir}")
+            return 1
+        except OSError as e:
+            print(f"Error: Could not read directory {pdf_dir}: {e.strerror}")
+            return 1
         if not pdf_files:
             print(f"No PDF files found in {pdf_dir}")
             return 1
 
-        print("=" * 80)
-        print(f"Processing all PDFs in: {pdf_dir}")
-        print("=" * 80)
-
+        # Outputs go to a folder named after the file stem, so e.g. foo.pdf
+        # and foo.PDF would overwrite each other
+        pdf_by_stem = {}
         for pdf_path in pdf_files:
-            print(f"\nProcessing {pdf_path.name}...")
-            process_pdf(pdf_path, args.output_dir, args.json_only)
+            other = pdf_by_stem.setdefault(pdf_path.stem, pdf_path)
+            if other is not pdf_path:
+                print(
+                    f"Error: {other.name} and {pdf_path.name} would share the output folder {pdf_path.stem}"
+                )
+                return 1
+
+        jobs = min(args.jobs, len(pdf_files))
+
+        print(SEPARATOR)
+        print(f"Processing all PDFs in: {pdf_dir} ({jobs} worker(s))")
+        print(SEPARATOR)
+
+        # Each PDF is independent, so fan them out across worker processes
+        worker = partial(
+            process_pdf,
+            output_root=output_root,
+            json_only=args.json_only,
+            quiet=args.quiet,
+            buffered=True,
+        )
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            list(executor.map(worker, pdf_files))
 
         print("\nBatch processing complete!\n")
         return 0
@@ -112,7 +178,7 @@ def main():
         return 1
 
     print(f"\nProcessing {pdf_path.name}...")
-    process_pdf(pdf_path, args.output_dir, args.json_only)
+    process_pdf(pdf_path, output_root, args.json_only, args.quiet)
     return 0
 
 
@@ -5,3 +5,6 @@ Global configuration for the formulary extractor application.
 
 # Global debug flag - set to True to enable detailed debug output
 DEBUG_MODE = False
+
+# Separator line used around console report sections
+SEPARATOR = "=" * 80
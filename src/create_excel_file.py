@@ -1,11 +1,26 @@
 import json
 from pathlib import Path
 import openpyxl
+from openpyxl.cell import Cell
 from openpyxl.styles import Font, PatternFill, Alignment
 from openpyxl.utils import get_column_letter
 from config import DEBUG_MODE
 
 
+def styled_cell(ws, value, fill=None, font=None, alignment=None):
+    """
+    Create a cell for ws.append(), applying any given styles.
+    """
+    cell = Cell(ws, value=value)
+    if fill is not None:
+        cell.fill = fill
+    if font is not None:
+        cell.font = font
+    if alignment is not None:
+        cell.alignment = alignment
+    return cell
+
+
 def create_excel_from_json(json_path, output_path):
     """
     Create an Excel file with multiple sheets from extracted JSON data.
@@ -33,19 +48,13 @@ def create_excel_from_json(json_path, output_path):
         start_color="4472C4", end_color="4472C4", fill_type="solid"
     )
     header_font = Font(bold=True, color="FFFFFF", size=12)
+    link_font = Font(color="0563C1", underline="single")
 
-    # Add header to Categories sheet
-    categories_sheet["A1"] = "Category"
-    categories_sheet["B1"] = "Total Subcategories"
-    categories_sheet["C1"] = "Total Drugs"
-    categories_sheet["D1"] = "Link"
-
-    for cell in ["A1", "B1", "C1", "D1"]:
-        categories_sheet[cell].fill = header_fill
-        categories_sheet[cell].font = header_font
-        categories_sheet[cell].alignment = Alignment(
-            horizontal="center", vertical="center"
-        )
+    # Shared cell alignments
+    left_alignment = Alignment(horizontal="left", vertical="center")
+    center_alignment = Alignment(horizontal="center", vertical="center")
+    wrap_alignment = Alignment(horizontal="left", vertical="top", wrap_text=True)
+    tier_alignment = Alignment(horizontal="center", vertical="top")
 
     # Set column widths for Categories sheet
     categories_sheet.column_dimensions["A"].width = 60
@@ -56,11 +65,21 @@ def create_excel_from_json(json_path, output_path):
     # Freeze the header row so it stays visible when scrolling
     categories_sheet.freeze_panes = "A2"
 
+    # Add header to Categories sheet
+    categories_sheet.append(
+        [
+            styled_cell(
+                categories_sheet, title, header_fill, header_font, center_alignment
+            )
+            for title in ["Category", "Total Subcategories", "Total Drugs", "Link"]
+        ]
+    )
+
     if DEBUG_MODE:
         print(f"\nCreating Excel file with {len(categories_data)} categories...")
 
     # Process each category
-    for idx, category in enumerate(categories_data, start=2):
+    for category in categories_data:
         category_name = category["categoryName"]
         subcategories = category["subCategories"]
 
@@ -73,48 +92,28 @@ def create_excel_from_json(json_path, output_path):
         for char in ["\\", "/", "*", "[", "]", ":", "?"]:
             sheet_name = sheet_name.replace(char, "-")
 
-        # Add category name (no link)
-        categories_sheet[f"A{idx}"] = category_name
-        categories_sheet[f"A{idx}"].alignment = Alignment(
-            horizontal="left", vertical="center"
+        # Add category name (no link), subcategory count, total drugs count
+        # and a link cell in a separate column
+        link_cell = styled_cell(
+            categories_sheet, "Go to sheet", font=link_font, alignment=center_alignment
         )
-
-        # Add subcategory count
-        categories_sheet[f"B{idx}"] = len(subcategories)
-        categories_sheet[f"B{idx}"].alignment = Alignment(
-            horizontal="center", vertical="center"
-        )
-
-        # Add total drugs count
-        categories_sheet[f"C{idx}"] = total_drugs
-        categories_sheet[f"C{idx}"].alignment = Alignment(
-            horizontal="center", vertical="center"
+        categories_sheet.append(
+            [
+                styled_cell(categories_sheet, category_name, alignment=left_alignment),
+                styled_cell(
+                    categories_sheet, len(subcategories), alignment=center_alignment
+                ),
+                styled_cell(categories_sheet, total_drugs, alignment=center_alignment),
+                link_cell,
+            ]
         )
-
-        # Add clickable link in separate column
-        link_cell = categories_sheet[f"D{idx}"]
-        link_cell.value = "Go to sheet"
+        # Add the clickable link once append() has placed the cell, since the
+        # hyperlink is anchored to the cell's position when assigned
         link_cell.hyperlink = f"#'{sheet_name}'!A1"
-        link_cell.font = Font(color="0563C1", underline="single")
-        link_cell.alignment = Alignment(horizontal="center", vertical="center")
 
         # Create a sheet for this category
         cat_sheet = wb.create_sheet(sheet_name)
 
-        # Add header row
-        cat_sheet["A1"] = "Category"
-        cat_sheet["B1"] = "Subcategory"
-        cat_sheet["C1"] = "Drug"
-        cat_sheet["D1"] = "Tier"
-        cat_sheet["E1"] = "Notes"
-
-        for cell in ["A1", "B1", "C1", "D1", "E1"]:
-            cat_sheet[cell].fill = header_fill
-            cat_sheet[cell].font = header_font
-            cat_sheet[cell].alignment = Alignment(
-                horizontal="center", vertical="center"
-            )
-
         # Set column widths to fit content
         cat_sheet.column_dimensions["A"].width = 45  # Category
         cat_sheet.column_dimensions["B"].width = 45  # Subcategory
@@ -125,37 +124,37 @@ def create_excel_from_json(json_path, output_path):
         # Freeze the header row so it stays visible when scrolling
         cat_sheet.freeze_panes = "A2"
 
+        # Add header row
+        cat_sheet.append(
+            [
+                styled_cell(
+                    cat_sheet, title, header_fill, header_font, center_alignment
+                )
+                for title in ["Category", "Subcategory", "Drug", "Tier", "Notes"]
+            ]
+        )
+
         # Add data rows
-        current_row = 2
         for subcat in subcategories:
             subcat_name = subcat["subCategoryName"]
             rows = subcat["rows"]
 
             for row_data in rows:
-                cat_sheet[f"A{current_row}"] = category_name
-                cat_sheet[f"B{current_row}"] = subcat_name
-                cat_sheet[f"C{current_row}"] = row_data["drug_name"]
-                cat_sheet[f"D{current_row}"] = row_data["tier"]
-                cat_sheet[f"E{current_row}"] = row_data["notes"]
-
-                # Alignment
-                cat_sheet[f"A{current_row}"].alignment = Alignment(
-                    horizontal="left", vertical="top", wrap_text=True
-                )
-                cat_sheet[f"B{current_row}"].alignment = Alignment(
-                    horizontal="left", vertical="top", wrap_text=True
-                )
-                cat_sheet[f"C{current_row}"].alignment = Alignment(
-                    horizontal="left", vertical="top", wrap_text=True
+                cat_sheet.append(
+                    [
+                        styled_cell(cat_sheet, category_name, alignment=wrap_alignment),
+                        styled_cell(cat_sheet, subcat_name, alignment=wrap_alignment),
+                        styled_cell(
+                            cat_sheet, row_data["drug_name"], alignment=wrap_alignment
+                        ),
+                        styled_cell(
+                            cat_sheet, row_data["tier"], alignment=tier_alignment
+                        ),
+                        styled_cell(
+                            cat_sheet, row_data["notes"], alignment=wrap_alignment
+                        ),
+                    ]
                 )
-                cat_sheet[f"D{current_row}"].alignment = Alignment(
-                    horizontal="center", vertical="top"
-                )
-                cat_sheet[f"E{current_row}"].alignment = Alignment(
-                    horizontal="left", vertical="top", wrap_text=True
-                )
-
-                current_row += 1
 
         if DEBUG_MODE:
             print(
@@ -4,7 +4,7 @@ import re
 import argparse
 import os
 from pathlib import Path
-from config import DEBUG_MODE
+from config import DEBUG_MODE, SEPARATOR
 
 
 def clean_text(text):
@@ -378,10 +378,10 @@ def main():
 
     if DEBUG_MODE:
         print("Starting PDF extraction...")
-        print("=" * 80)
+        print(SEPARATOR)
         print(f"Input PDF: {args.pdf_path}")
         print(f"Output directory: {output_dir}")
-        print("=" * 80)
+        print(SEPARATOR)
 
     data = extract_structured_data(args.pdf_path)
 
@@ -401,7 +401,7 @@ def main():
         json.dump(data["table_of_contents"], f, indent=2, ensure_ascii=False)
 
     if DEBUG_MODE:
-        print("\n" + "=" * 80)
+        print("\n" + SEPARATOR)
         print(f"Extraction complete!")
         print(f"  - Categories saved to: {output_file}")
         print(f"  - Warnings saved to: {warnings_file}")
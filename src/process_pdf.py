@@ -3,12 +3,48 @@
 PDF processing module for extracting formulary data and creating output files.
 """
 
+import io
 import json
+import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from extract_pdf_tables import extract_structured_data
-from create_excel_file import create_excel_from_json
-from config import DEBUG_MODE
+from config import DEBUG_MODE, SEPARATOR
+
+
+def dump_json(obj) -> bytes:
+    """
+    Serialize obj to indented UTF-8 JSON bytes, using orjson when available.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def write_json_array(path: Path, items: list):
+    """
+    Stream a list to path as indented JSON, one element at a time.
+
+    Produces the same bytes as writing dump_json(items), without holding the
+    whole serialized document in memory.
+    """
+    if not items:
+        path.write_bytes(dump_json(items))
+        return
+
+    with open(path, "wb", buffering=1 << 20) as f:
+        f.write(b"[\n  ")
+        for index, item in enumerate(items):
+            if index:
+                f.write(b",\n  ")
+            # Nest each element one level deeper, as if dumped inside the list
+            f.write(dump_json(item).replace(b"\n", b"\n  "))
+        f.write(b"\n]")
 
 
 def print_summary(
@@ -19,35 +55,37 @@ def print_summary(
     total_subcategories: int,
     total_rows: int,
     excel_output_path: Path = None,
+    file=None,
 ):
     """
-    Print a summary of the extracted data.
+    Print a summary of the extracted data to file (default: stdout).
     """
-    print("=" * 80)
-    print(f"Extraction complete!")
-    print(f"  - Categories saved to: {json_output_path}")
-    print(f"  - Warnings saved to: {warnings_path}")
-    print(f"  - Table of Contents saved to: {toc_path}")
+    print(SEPARATOR, file=file)
+    print(f"Extraction complete!", file=file)
+    print(f"  - Categories saved to: {json_output_path}", file=file)
+    print(f"  - Warnings saved to: {warnings_path}", file=file)
+    print(f"  - Table of Contents saved to: {toc_path}", file=file)
     if excel_output_path:
-        print(f"  - Excel file saved to: {excel_output_path}")
+        print(f"  - Excel file saved to: {excel_output_path}", file=file)
 
-    print(f"\nSummary:")
-    print(f"  - ToC entries found: {len(data['table_of_contents'])}")
-    print(f"  - Categories found: {len(data['categories'])}")
-    print(f"  - Total subcategories: {total_subcategories}")
-    print(f"  - Total rows extracted: {total_rows}")
-    print(f"  - Total rows processed: {data['total_rows_processed']}")
-    print(f"  - Warnings (skipped rows): {len(data['warnings'])}")
+    print(f"\nSummary:", file=file)
+    print(f"  - ToC entries found: {len(data['table_of_contents'])}", file=file)
+    print(f"  - Categories found: {len(data['categories'])}", file=file)
+    print(f"  - Total subcategories: {total_subcategories}", file=file)
+    print(f"  - Total rows extracted: {total_rows}", file=file)
+    print(f"  - Total rows processed: {data['total_rows_processed']}", file=file)
+    print(f"  - Warnings (skipped rows): {len(data['warnings'])}", file=file)
 
     # Validation checks
-    print(f"\nValidation:")
+    print(f"\nValidation:", file=file)
 
     # Check 1: ToC entries should match categories found
     toc_count = len(data["table_of_contents"])
     categories_count = len(data["categories"])
     toc_match = toc_count == categories_count
     print(
-        f"  - ToC entries ({toc_count}) == Categories found ({categories_count}) {'✓' if toc_match else '✗'}"
+        f"  - ToC entries ({toc_count}) == Categories found ({categories_count}) {'✓' if toc_match else '✗'}",
+        file=file,
     )
 
     # Check 2: Total rows processed should equal sum of all components
@@ -57,111 +95,145 @@ def print_summary(
     actual_total = data["total_rows_processed"]
     rows_match = expected_total == actual_total
     print(
-        f"  - Total rows processed ({actual_total}) == Sum of components ({expected_total}) {'✓' if rows_match else '✗'}"
+        f"  - Total rows processed ({actual_total}) == Sum of components ({expected_total}) {'✓' if rows_match else '✗'}",
+        file=file,
     )
     print(
-        f"    Expected: {total_rows} drugs + {categories_count} categories + {total_subcategories} subcategories + {len(data['warnings'])} warnings = {expected_total}"
+        f"    Expected: {total_rows} drugs + {categories_count} categories + {total_subcategories} subcategories + {len(data['warnings'])} warnings = {expected_total}",
+        file=file,
     )
 
     # Check 3: Warnings should be zero for clean extraction
     no_warnings = len(data["warnings"]) == 0
-    print(f"  - No warnings (clean extraction) {'✓' if no_warnings else '✗'}")
+    print(
+        f"  - No warnings (clean extraction) {'✓' if no_warnings else '✗'}", file=file
+    )
 
     # Check 4: Overall status
     all_good = toc_match and rows_match and no_warnings
     print(
-        f"  - Overall extraction quality: {'✓ EXCELLENT' if all_good else '(!) NEEDS REVIEW'}"
+        f"  - Overall extraction quality: {'✓ EXCELLENT' if all_good else '(!) NEEDS REVIEW'}",
+        file=file,
     )
 
-    print("=" * 80 + "\n")
+    print(SEPARATOR + "\n", file=file)
 
 
-def process_pdf(pdf_path: Path, output_dir: str, json_only: bool):
+def process_pdf(
+    pdf_path: Path,
+    output_root: Path,
+    json_only: bool,
+    quiet: bool = False,
+    buffered: bool = False,
+):
     """
     Process a single PDF: extract data, save JSON, and optionally create Excel.
+
+    With buffered, the report (headed by the PDF's name) is collected and
+    written to stdout in one go, so reports from parallel batch workers don't
+    interleave. In DEBUG_MODE it is always written directly, to stay in order
+    with the extractor's and Excel writer's own debug output. With quiet, the
+    per-PDF summary is skipped.
     """
-    if DEBUG_MODE:
-        print("=" * 80)
-        print(f"STEP 1: PDF EXTRACTION for {pdf_path.name}")
-        print("=" * 80)
-
-    # Create output directory: output/PDFFILENAME/
-    pdf_filename = pdf_path.stem
-    pdf_output_dir = Path(output_dir) / pdf_filename
-    pdf_output_dir.mkdir(parents=True, exist_ok=True)
-
-    if DEBUG_MODE:
-        print(f"Input PDF: {pdf_path}")
-        print(f"Output directory: {pdf_output_dir}")
-        print("=" * 80)
-
-    # Extract data from PDF
-    data = extract_structured_data(str(pdf_path))
-
-    # Save JSON files
-    json_output_path = pdf_output_dir / "extracted_data.json"
-    warnings_path = pdf_output_dir / "extraction_warnings.json"
-    toc_path = pdf_output_dir / "table_of_contents.json"
-
-    with open(json_output_path, "w", encoding="utf-8") as f:
-        json.dump(data["categories"], f, indent=2, ensure_ascii=False)
-
-    with open(warnings_path, "w", encoding="utf-8") as f:
-        json.dump(data["warnings"], f, indent=2, ensure_ascii=False)
-
-    with open(toc_path, "w", encoding="utf-8") as f:
-        json.dump(data["table_of_contents"], f, indent=2, ensure_ascii=False)
-
-    # Count total subcategories and rows
-    total_subcategories = sum(len(cat["subCategories"]) for cat in data["categories"])
-    total_rows = sum(
-        len(subcat["rows"])
-        for cat in data["categories"]
-        for subcat in cat["subCategories"]
-    )
+    log = io.StringIO() if buffered and not DEBUG_MODE else sys.stdout
+    try:
+        if buffered:
+            print(f"\nProcessing {pdf_path.name}...", file=log)
 
-    # Stop here if --json-only
-    if json_only:
-        print_summary(
-            json_output_path,
-            warnings_path,
-            toc_path,
-            data,
-            total_subcategories,
-            total_rows,
-        )
         if DEBUG_MODE:
-            print("\n" + "=" * 80)
-            print("JSON-only mode: Skipping Excel creation")
-            print("=" * 80)
-        return
-
-    # Excel Creation
-    if DEBUG_MODE:
-        print("\n" + "=" * 80)
-        print("STEP 2: EXCEL CREATION")
-        print("=" * 80)
+            print(SEPARATOR, file=log)
+            print(f"STEP 1: PDF EXTRACTION for {pdf_path.name}", file=log)
+            print(SEPARATOR, file=log)
 
-    excel_output_path = pdf_output_dir / f"{pdf_filename}.xlsx"
+        # Create output directory: output/PDFFILENAME/
+        pdf_filename = pdf_path.stem
+        pdf_output_dir = output_root / pdf_filename
+        pdf_output_dir.mkdir(parents=True, exist_ok=True)
 
-    try:
-        create_excel_from_json(json_output_path, excel_output_path)
-
-        print_summary(
-            json_output_path,
-            warnings_path,
-            toc_path,
-            data,
-            total_subcategories,
-            total_rows,
-            excel_output_path,
-        )
-
-    except ImportError as e:
-        print(f"\nWarning: Could not create Excel file")
-        print(f"  Error: {e}")
-        print(f"  Please install openpyxl: pip install openpyxl")
-        print(f"\n  JSON files have been created successfully in: {pdf_output_dir}")
-    except Exception as e:
-        print(f"\nError creating Excel file: {e}")
-        print(f"  JSON files have been created successfully in: {pdf_output_dir}")
+        if DEBUG_MODE:
+            print(f"Input PDF: {pdf_path}", file=log)
+            print(f"Output directory: {pdf_output_dir}", file=log)
+            print(SEPARATOR, file=log)
+
+        # Extract data from PDF
+        data = extract_structured_data(str(pdf_path))
+
+        # Save JSON files
+        json_output_path = pdf_output_dir / "extracted_data.json"
+        warnings_path = pdf_output_dir / "extraction_warnings.json"
+        toc_path = pdf_output_dir / "table_of_contents.json"
+
+        write_json_array(json_output_path, data["categories"])
+        warnings_path.write_bytes(dump_json(data["warnings"]))
+        toc_path.write_bytes(dump_json(data["table_of_contents"]))
+
+        # Count total subcategories and rows in a single pass
+        total_subcategories = 0
+        total_rows = 0
+        for cat in data["categories"]:
+            subcategories = cat["subCategories"]
+            total_subcategories += len(subcategories)
+            for subcat in subcategories:
+                total_rows += len(subcat["rows"])
+
+        # Stop here if --json-only
+        if json_only:
+            if not quiet:
+                print_summary(
+                    json_output_path,
+                    warnings_path,
+                    toc_path,
+                    data,
+                    total_subcategories,
+                    total_rows,
+                    file=log,
+                )
+            if DEBUG_MODE:
+                print("\n" + SEPARATOR, file=log)
+                print("JSON-only mode: Skipping Excel creation", file=log)
+                print(SEPARATOR, file=log)
+            return
+
+        # Excel Creation
+        if DEBUG_MODE:
+            print("\n" + SEPARATOR, file=log)
+            print("STEP 2: EXCEL CREATION", file=log)
+            print(SEPARATOR, file=log)
+
+        excel_output_path = pdf_output_dir / f"{pdf_filename}.xlsx"
+
+        try:
+            # Imported here so --json-only runs never load openpyxl
+            from create_excel_file import create_excel_from_json
+
+            create_excel_from_json(json_output_path, excel_output_path)
+
+            if not quiet:
+                print_summary(
+                    json_output_path,
+                    warnings_path,
+                    toc_path,
+                    data,
+                    total_subcategories,
+                    total_rows,
+                    excel_output_path,
+                    file=log,
+                )
+
+        except ImportError as e:
+            print(f"\nWarning: Could not create Excel file", file=log)
+            print(f"  Error: {e}", file=log)
+            print(f"  Please install openpyxl: pip install openpyxl", file=log)
+            print(
+                f"\n  JSON files have been created successfully in: {pdf_output_dir}",
+                file=log,
+            )
+        except Exception as e:
+            print(f"\nError creating Excel file: {e}", file=log)
+            print(
+                f"  JSON files have been created successfully in: {pdf_output_dir}",
+                file=log,
+            )
+    finally:
+        if log is not sys.stdout:
+            sys.stdout.write(log.getvalue())